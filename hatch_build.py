@@ -0,0 +1,18 @@
+"""Hatch build hook: regenerate the pickled data caches before packaging."""
+import importlib.util
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class DataCacheBuildHook(BuildHookInterface):
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version, build_data):
+        # Load build_cache by path: importing the package would pull in the
+        # server and its runtime dependencies, which the build env lacks.
+        path = Path(self.root) / "src" / "mcp_emc_regulations" / "build_cache.py"
+        spec = importlib.util.spec_from_file_location("_mcp_emc_build_cache", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        module.build_cache()
@@ -0,0 +1,32 @@
+"""Precompile the bundled JSON data files into pickle caches.
+
+The hatch build hook (``hatch_build.py``) runs this for every build, so
+wheels ship the caches; run ``python -m mcp_emc_regulations.build_cache`` by
+hand after editing a data file in a source checkout. The JSON files stay the canonical source; the server loads a ``.pkl`` only
+when it is at least as new as the JSON it was built from.
+"""
+import json
+import pickle
+from pathlib import Path
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+def build_cache(data_dir: Path = DATA_DIR) -> list[Path]:
+    """Write a ``.pkl`` beside every ``.json`` data file."""
+    written = []
+    for json_path in sorted(data_dir.glob("*.json")):
+        data = json.loads(json_path.read_bytes())
+        cache_path = json_path.with_suffix(".pkl")
+        cache_path.write_bytes(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        written.append(cache_path)
+    return written
+
+
+def main():
+    for path in build_cache():
+        print(f"Wrote {path.name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,19 @@
 """MCP server for EMC/RF regulatory lookup."""
+import asyncio
+import contextlib
+import functools
+import hashlib
+import importlib.util
 import json
+import mmap
+import os
+import pickle
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -8,872 +22,1532 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
+try:
+    from orjson import loads as json_loads
+    JSON_LOADS_BUFFER = True
+except ImportError:
+    json_loads = json.loads
+    JSON_LOADS_BUFFER = False
+
 DATA_DIR = Path(__file__).parent / "data"
 
 
+def load_mapped(filepath: Path, loads: Callable[[Any], Any]) -> Any:
+    """Decode a file with loads, straight from a read-only mmap.
+
+    Empty files cannot be mapped, so they are passed as ``read_bytes``.
+    """
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return loads(view)
+    return loads(filepath.read_bytes())
+
+
+def read_json_file(filepath: Path) -> Any:
+    """Parse a JSON file, from a mmap when orjson is available (the stdlib parser cannot take a buffer)."""
+    if JSON_LOADS_BUFFER:
+        return load_mapped(filepath, json_loads)
+    return json_loads(filepath.read_bytes())
+
+
+@functools.cache
 def load_json(filename: str) -> dict:
-    """Load a JSON data file."""
+    """Load a JSON data file (parsed once per process).
+
+    Prefers the pickled copy written by ``build_cache`` when it is at least
+    as new as the JSON source.
+    """
     filepath = DATA_DIR / filename
     if filepath.exists():
-        return json.loads(filepath.read_text())
+        cache_path = filepath.with_suffix(".pkl")
+        if cache_path.exists() and cache_path.stat().st_mtime >= filepath.stat().st_mtime:
+            return load_mapped(cache_path, pickle.loads)
+        return read_json_file(filepath)
     return {}
 
 
+DATA_FILES = (
+    "part15_limits.json",
+    "part18_limits.json",
+    "restricted_bands.json",
+    "cispr_limits.json",
+    "cispr25_limits.json",
+    "automotive_emc.json",
+    "lte_bands.json",
+    "nr_bands.json",
+)
+
+
+def load_data_files() -> list[dict]:
+    """Load all DATA_FILES, overlapping the file reads in a thread pool."""
+    with ThreadPoolExecutor(max_workers=len(DATA_FILES)) as pool:
+        return list(pool.map(load_json, DATA_FILES))
+
+
 # Load all data files
-PART15_LIMITS = load_json("part15_limits.json")
-PART18_LIMITS = load_json("part18_limits.json")
-RESTRICTED_BANDS = load_json("restricted_bands.json")
-CISPR_LIMITS = load_json("cispr_limits.json")
-CISPR25_LIMITS = load_json("cispr25_limits.json")
-AUTOMOTIVE_EMC = load_json("automotive_emc.json")
-LTE_BANDS = load_json("lte_bands.json")
-NR_BANDS = load_json("nr_bands.json")
+(
+    PART15_LIMITS,
+    PART18_LIMITS,
+    RESTRICTED_BANDS,
+    CISPR_LIMITS,
+    CISPR25_LIMITS,
+    AUTOMOTIVE_EMC,
+    LTE_BANDS,
+    NR_BANDS,
+) = load_data_files()
 
-server = Server("mcp-emc-regulations")
+# Band lookup tables (NR names and regions are stored lowercased)
+LTE_BANDS_BY_NUMBER = {band['band']: band for band in LTE_BANDS.get('bands', [])}
+NR_BANDS_BY_NAME = {
+    band['band'].lower(): band
+    for section in ('fr1_bands', 'fr2_bands')
+    for band in NR_BANDS.get(section, {}).get('bands', [])
+}
 
 
-def format_limit_result(limit: dict, section: str = "") -> str:
-    """Format a limit entry for display."""
-    freq_range = f"{limit.get('freq_min_mhz', '?')} - {limit.get('freq_max_mhz', '?')} MHz"
-
-    if 'limit_dbuv_m' in limit:
-        value = f"{limit['limit_dbuv_m']} dBuV/m"
-    elif 'limit_uv_m' in limit:
-        value = f"{limit['limit_uv_m']} uV/m ({limit.get('limit_dbuv_m', '?')} dBuV/m)"
-    elif 'limit_dbuv' in limit:
-        value = f"{limit['limit_dbuv']} dBuV"
-    elif 'limit_dbuv_qp' in limit:
-        value = f"QP: {limit['limit_dbuv_qp']} dBuV/m, Avg: {limit.get('limit_dbuv_avg', '?')} dBuV/m"
-    else:
-        value = "See notes"
+def _lte_bands_by_region() -> dict[str, list[dict]]:
+    """Group LTE bands by lowercased region, keeping band order."""
+    by_region = {}
+    for band in LTE_BANDS.get('bands', []):
+        for region in dict.fromkeys(r.lower() for r in band.get('regions', [])):
+            by_region.setdefault(region, []).append(band)
+    return by_region
+
+
+LTE_BANDS_BY_REGION = _lte_bands_by_region()
+
+
+@dataclass(frozen=True, slots=True)
+class LimitRow:
+    """One frequency range of an emission limit table."""
+    freq_min_mhz: float
+    freq_max_mhz: float
+    limit_dbuv_m: float | None = None
+    limit_uv_m: float | None = None
+    limit_dbuv: float | None = None
+    limit_dbuv_qp: float | None = None
+    limit_dbuv_avg: float | None = None
+    distance_m: float | None = None
+    measurement_distance_m: float | None = None
+    detector: str | None = None
+    formula: str | None = None
+    name: str | None = None
+    notes: str | None = None
+    display: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'display', _render_limit_row(self))
+
+
+def _or_unknown(value: Any) -> Any:
+    return '?' if value is None else value
+
+
+def _fmt_dbuv_m(limit: LimitRow) -> str:
+    return f"{limit.limit_dbuv_m} dBuV/m"
+
+
+def _fmt_uv_m(limit: LimitRow) -> str:
+    return f"{limit.limit_uv_m} uV/m ({_or_unknown(limit.limit_dbuv_m)} dBuV/m)"
+
+
+def _fmt_dbuv(limit: LimitRow) -> str:
+    return f"{limit.limit_dbuv} dBuV"
+
 
-    distance = f"@ {limit['distance_m']}m" if 'distance_m' in limit else ""
-    detector = f"({limit['detector']})" if 'detector' in limit else ""
-    notes = f" - {limit['notes']}" if 'notes' in limit else ""
+def _fmt_qp_avg(limit: LimitRow) -> str:
+    return f"QP: {limit.limit_dbuv_qp} dBuV/m, Avg: {_or_unknown(limit.limit_dbuv_avg)} dBuV/m"
 
+
+def _fmt_see_notes(limit: LimitRow) -> str:
+    return "See notes"
+
+
+# Value formatters by limit key, in priority order
+VALUE_FORMATTERS: dict[str, Callable[[LimitRow], str]] = {
+    'limit_dbuv_m': _fmt_dbuv_m,
+    'limit_uv_m': _fmt_uv_m,
+    'limit_dbuv': _fmt_dbuv,
+    'limit_dbuv_qp': _fmt_qp_avg,
+}
+
+
+def select_value_formatter(limit: LimitRow) -> Callable[[LimitRow], str]:
+    """Pick the value formatter for a limit row (the first limit key present wins)."""
+    for key, formatter in VALUE_FORMATTERS.items():
+        if getattr(limit, key) is not None:
+            return formatter
+    return _fmt_see_notes
+
+
+def _render_limit_row(limit: LimitRow) -> str:
+    """Render the display line for a limit row; done once, when the row is built."""
+    freq_range = f"{limit.freq_min_mhz} - {limit.freq_max_mhz} MHz"
+    value = select_value_formatter(limit)(limit)
+    distance = f"@ {limit.distance_m}m" if limit.distance_m is not None else ""
+    detector = f"({limit.detector})" if limit.detector is not None else ""
+    notes = f" - {limit.notes}" if limit.notes is not None else ""
     return f"  {freq_range}: {value} {distance} {detector}{notes}"
 
 
-def find_limit_for_frequency(limits: list, freq_mhz: float) -> dict | None:
-    """Find the applicable limit for a given frequency."""
-    for limit in limits:
-        if limit['freq_min_mhz'] <= freq_mhz < limit['freq_max_mhz']:
-            return limit
-    return None
+@dataclass(frozen=True, slots=True)
+class RestrictedBand:
+    """A Part 15.205 restricted band, with its response lines pre-rendered."""
+    freq_min_mhz: float
+    freq_max_mhz: float
+    service: str
+    warning_line: str = field(init=False, repr=False, compare=False)
+    detail_text: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        band_range = f"{self.freq_min_mhz} - {self.freq_max_mhz} MHz"
+        object.__setattr__(self, 'warning_line', f"   {band_range}: {self.service}")
+        object.__setattr__(self, 'detail_text', f"  Band: {band_range}\n  Protected Service: {self.service}\n\n")
+
+
+@dataclass(frozen=True, slots=True)
+class IsmBand:
+    """An ITU ISM band."""
+    center_mhz: float
+    range_mhz: tuple[float, float] = (0, 0)
+    tolerance_percent: float | None = None
+    notes: str | None = None
+
+    def __post_init__(self):
+        object.__setattr__(self, 'range_mhz', tuple(self.range_mhz))
+
+
+def row_from_dict(row_type: type, entry: dict):
+    """Build a row object from a JSON entry, ignoring keys the row does not define."""
+    fields = row_type.__dataclass_fields__
+    return row_type(**{key: value for key, value in entry.items() if key in fields and fields[key].init})
+
+
+@dataclass(frozen=True, slots=True)
+class IntervalIndex:
+    """Sorted interval index over a static list of bands/limits.
+
+    The bounds are stored as parallel columns sorted by lower edge. reach[i]
+    is the highest upper edge among sorted entries 0..i, so a lookup walking
+    left from the bisect point can stop as soon as no earlier entry can
+    contain the frequency. order[i] is the entry's position in the source
+    list, which keeps "first match wins" semantics for overlapping entries.
+    Tables whose entries never overlap are answered with a single probe.
+    """
+    mins: list[float]
+    maxs: list[float]
+    reach: list[float]
+    order: list[int]
+    rows: list
+    disjoint_open: bool
+    disjoint_closed: bool
+
+
+def _freq_bounds(entry: dict) -> tuple[float, float]:
+    return entry['freq_min_mhz'], entry['freq_max_mhz']
+
+
+def _range_bounds(entry: dict) -> tuple[float, float]:
+    range_mhz = entry.get('range_mhz', [0, 0])
+    return range_mhz[0], range_mhz[1]
+
+
+def build_interval_index(
+    items: list,
+    bounds: Callable[[dict], tuple[float, float]] = _freq_bounds,
+    row_type: type | None = None,
+) -> IntervalIndex:
+    """Build a sorted interval index for point-in-interval lookups.
+
+    If row_type is given, lookups return row_type instances built from the
+    source entries instead of the entries themselves.
+    """
+    edges = sorted((*bounds(item), pos) for pos, item in enumerate(items))
+    mins = [lo for lo, _, _ in edges]
+    maxs = [hi for _, hi, _ in edges]
+    order = [pos for _, _, pos in edges]
+    reach = []
+    highest = float('-inf')
+    for hi in maxs:
+        highest = max(highest, hi)
+        reach.append(highest)
+    rows = [row_from_dict(row_type, item) for item in items] if row_type else list(items)
+    gaps = list(zip(reach, mins[1:]))
+    return IntervalIndex(
+        mins, maxs, reach, order, rows,
+        disjoint_open=all(prev_hi <= lo for prev_hi, lo in gaps),
+        disjoint_closed=all(prev_hi < lo for prev_hi, lo in gaps),
+    )
+
+
+def stab_interval_index(index: IntervalIndex, freq_mhz: float, closed: bool = False) -> list:
+    """Return all entries containing freq_mhz, in source-list order.
+
+    Intervals are half-open [min, max) unless closed is True.
+    """
+    mins, maxs, reach, order = index.mins, index.maxs, index.reach, index.order
+    hits = []
+    i = bisect_right(mins, freq_mhz) - 1
+    while i >= 0 and reach[i] >= freq_mhz:
+        if freq_mhz < maxs[i] or (closed and freq_mhz == maxs[i]):
+            hits.append(order[i])
+        i -= 1
+    hits.sort()
+    return [index.rows[pos] for pos in hits]
+
+
+def overlapping_interval_positions(index: IntervalIndex, freq_min: float, freq_max: float) -> list[int]:
+    """Return source-list positions of entries overlapping [freq_min, freq_max] (closed), ascending."""
+    # reach is non-decreasing, so everything before start ends below freq_min;
+    # everything from end on starts above freq_max.
+    start = bisect_left(index.reach, freq_min)
+    end = bisect_right(index.mins, freq_max)
+    maxs, order = index.maxs, index.order
+    return sorted(order[i] for i in range(start, end) if maxs[i] >= freq_min)
+
+
+def first_in_interval_index(index: IntervalIndex, freq_mhz: float, closed: bool = False):
+    """Return the first entry (in source-list order) containing freq_mhz."""
+    if index.disjoint_closed if closed else index.disjoint_open:
+        i = bisect_right(index.mins, freq_mhz) - 1
+        if i >= 0:
+            hi = index.maxs[i]
+            if freq_mhz < hi or (closed and freq_mhz == hi):
+                return index.rows[index.order[i]]
+        return None
+    hits = stab_interval_index(index, freq_mhz, closed)
+    return hits[0] if hits else None
+
+
+@dataclass(frozen=True, slots=True)
+class SegmentTable:
+    """Precomputed stabbing answers for every elementary segment of an index.
+
+    points are the sorted distinct interval edges. at_point[i] holds the
+    matching rows for a frequency equal to points[i]; between[i] holds them
+    for a frequency strictly between points[i-1] and points[i] (between[0]
+    is below the lowest edge, between[-1] above the highest).
+    """
+    points: list[float]
+    at_point: list[tuple]
+    between: list[tuple]
+
+
+def build_segment_table(index: IntervalIndex, closed: bool = False) -> SegmentTable:
+    """Answer every possible stabbing query of an index once, up front."""
+    points = sorted(set(index.mins) | set(index.maxs))
+    at_point = [tuple(stab_interval_index(index, point, closed)) for point in points]
+    between = [()]
+    for lo, hi in zip(points, points[1:]):
+        between.append(tuple(stab_interval_index(index, (lo + hi) / 2, closed)))
+    between.append(())
+    return SegmentTable(points, at_point, between)
+
+
+def stab_segment_table(table: SegmentTable, freq_mhz: float) -> tuple:
+    """Return the rows containing freq_mhz, in source-list order."""
+    i = bisect_left(table.points, freq_mhz)
+    if i < len(table.points) and table.points[i] == freq_mhz:
+        return table.at_point[i]
+    return table.between[i]
+
+
+RESTRICTED_BAND_INDEX = build_interval_index(
+    RESTRICTED_BANDS.get('restricted_bands', []), row_type=RestrictedBand
+)
+ISM_BAND_INDEX = build_interval_index(
+    PART18_LIMITS.get('ism_bands', {}).get('bands', []), _range_bounds, row_type=IsmBand
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Part15Section:
+    """One Part 15 section: its heading and limit tables by device class."""
+    header: str
+    limits: dict[str | None, IntervalIndex]
+    class_headers: dict[str, str] = field(default_factory=dict)
+
+
+def _part15_class_limits(sec_data: dict) -> dict[str | None, IntervalIndex]:
+    return {
+        device_class: build_interval_index(
+            sec_data.get(f"class_{device_class.lower()}", {}).get("limits", []), row_type=LimitRow
+        )
+        for device_class in ("A", "B")
+    }
+
+
+def _build_part15_sections() -> dict[str, Part15Section]:
+    """Resolve the sections of PART15_LIMITS once; 15.209 has no device class (key None)."""
+    sec_109 = PART15_LIMITS.get("section_15_109", {})
+    sec_207 = PART15_LIMITS.get("section_15_207", {})
+    sec_209 = PART15_LIMITS.get("section_15_209", {})
+    return {
+        "15.109": Part15Section(
+            header=f"\n## Section 15.109 - {sec_109.get('title', 'Radiated Emission Limits')}",
+            limits=_part15_class_limits(sec_109),
+            class_headers={
+                "A": f"\nClass A ({sec_109.get('class_a', {}).get('description', 'Commercial')}):",
+                "B": f"\nClass B ({sec_109.get('class_b', {}).get('description', 'Residential')}):",
+            },
+        ),
+        "15.207": Part15Section(
+            header=f"\n## Section 15.207 - {sec_207.get('title', 'Conducted Limits')}",
+            limits=_part15_class_limits(sec_207),
+            class_headers={"A": "\nClass A:", "B": "\nClass B:"},
+        ),
+        "15.209": Part15Section(
+            header=f"\n## Section 15.209 - {sec_209.get('title', 'Intentional Radiators')}",
+            limits={None: build_interval_index(sec_209.get("limits", []), row_type=LimitRow)},
+        ),
+    }
+
+
+PART15_SECTIONS = _build_part15_sections()
+
+# Part 18.305 limits outside the ISM bands, by equipment type ("consumer", "industrial")
+PART18_LIMIT_INDEX = {
+    key.removesuffix("_ism"): build_interval_index(eq_data.get("emissions_outside_ism", []), row_type=LimitRow)
+    for key, eq_data in PART18_LIMITS.get("section_18_305", {}).items()
+    if key.endswith("_ism") and isinstance(eq_data, dict)
+}
+
+
+def _build_cispr25_limit_index() -> dict[tuple[str, str], IntervalIndex]:
+    """Index the CISPR 25 limit lists by (emission type, class key), e.g. ("radiated", "class_3")."""
+    sources = {
+        "radiated": CISPR25_LIMITS.get('radiated_emissions', {}).get('broadband', {}).get('limits', {}),
+        "conducted": CISPR25_LIMITS.get('conducted_emissions', {}).get('voltage_method', {}).get('limits', {}),
+    }
+    return {
+        (emission_type, class_key): build_interval_index(limits, row_type=LimitRow)
+        for emission_type, limits_data in sources.items()
+        for class_key, limits in limits_data.items()
+    }
+
+
+CISPR25_LIMIT_INDEX = _build_cispr25_limit_index()
+
+_CISPR12_LIMITS = AUTOMOTIVE_EMC.get('cispr_12', {}).get('limits', {})
+CISPR12_BROADBAND_INDEX = build_interval_index(_CISPR12_LIMITS.get('broadband', []), row_type=LimitRow)
+CISPR12_NARROWBAND_INDEX = build_interval_index(_CISPR12_LIMITS.get('narrowband', []), row_type=LimitRow)
+
+
+def _cellular_band_intervals() -> list[tuple[float, float, str]]:
+    """Flatten LTE/NR uplink, downlink and FR2 ranges into (min, max, label) entries."""
+    intervals = []
+    for band in LTE_BANDS.get('bands', []):
+        ul = band.get('uplink_mhz')
+        dl = band.get('downlink_mhz')
+        if ul:
+            intervals.append((ul[0], ul[1], f"LTE Band {band['band']} (uplink)"))
+        if dl:
+            intervals.append((dl[0], dl[1], f"LTE Band {band['band']} (downlink)"))
+
+    for band in NR_BANDS.get('fr1_bands', {}).get('bands', []):
+        ul = band.get('uplink_mhz')
+        dl = band.get('downlink_mhz')
+        if ul:
+            intervals.append((ul[0], ul[1], f"NR {band['band']} (uplink)"))
+        if dl:
+            intervals.append((dl[0], dl[1], f"NR {band['band']} (downlink)"))
+
+    for band in NR_BANDS.get('fr2_bands', {}).get('bands', []):
+        rng = band.get('range_mhz')
+        if rng:
+            intervals.append((rng[0], rng[1], f"NR {band['band']}"))
+    return intervals
+
+
+CELLULAR_BAND_INDEX = build_interval_index(_cellular_band_intervals(), lambda entry: (entry[0], entry[1]))
+CELLULAR_BAND_SEGMENTS = build_segment_table(CELLULAR_BAND_INDEX, closed=True)
+
+
+@dataclass(frozen=True, slots=True)
+class CisprClassLimits:
+    """Pre-resolved radiated/conducted limit tables for one CISPR class."""
+    radiated: IntervalIndex
+    radiated_distance_m: Any
+    above_1ghz: IntervalIndex | None
+    above_1ghz_distance_m: Any
+    conducted: IntervalIndex
+    conducted_port: str
+
+
+def _build_cispr_class_limits() -> dict[tuple[str, str], CisprClassLimits | None]:
+    """Resolve every (standard key, class letter) pair of CISPR_LIMITS once."""
+    index = {}
+    for data_key in ('cispr_32', 'cispr_11', 'cispr_14_1'):
+        data = CISPR_LIMITS.get(data_key, {})
+        for device_class in ('a', 'b'):
+            class_key = f"class_{device_class}"
+            class_data = data.get(class_key, data.get('group_1', {}).get(class_key, {}))
+            if not class_data:
+                index[data_key, device_class] = None
+                continue
+
+            rad_data = class_data.get('radiated_emissions', {})
+            above_1g = rad_data.get('above_1ghz', {})
+            cond_data = class_data.get('conducted_emissions', {})
+            index[data_key, device_class] = CisprClassLimits(
+                radiated=build_interval_index(rad_data.get('limits', []), row_type=LimitRow),
+                radiated_distance_m=rad_data.get('measurement_distance_m', '?'),
+                above_1ghz=build_interval_index(above_1g.get('limits', []), row_type=LimitRow) if above_1g else None,
+                above_1ghz_distance_m=above_1g.get('measurement_distance_m', '?'),
+                conducted=build_interval_index(cond_data.get('limits', []), row_type=LimitRow),
+                conducted_port=cond_data.get('port', 'AC mains'),
+            )
+    return index
 
 
-def check_restricted_band(freq_mhz: float) -> dict | None:
+CISPR_CLASS_LIMITS = _build_cispr_class_limits()
+
+server = Server("mcp-emc-regulations")
+
+# Shared HTTP client for eCFR queries, so connections (and TLS sessions) are
+# kept alive across calls. HTTP/2 is used when the optional h2 package is
+# installed.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            headers={"Accept": "application/json"},
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared HTTP client if it was opened."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+ECFR_MAX_CHARS = 8000
+_PRETTY_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+
+def dumps_truncated(data: Any, max_chars: int) -> tuple[str, bool]:
+    """Pretty-print data as JSON, stopping once more than max_chars have been produced.
+
+    Returns json.dumps(data, indent=2)[:max_chars] and whether anything was
+    cut off, without serializing the rest of a large document.
+    """
+    chunks = []
+    size = 0
+    for chunk in _PRETTY_JSON_ENCODER.iterencode(data):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > max_chars:
+            break
+    return "".join(chunks)[:max_chars], size > max_chars
+
+
+# Rendered eCFR responses, cached in memory and on disk keyed by request URL.
+ECFR_CACHE_TTL_S = 24 * 60 * 60
+ECFR_CACHE_MAXSIZE = 128
+# Memory tier, least recently used first
+_ecfr_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+# Per-URL fetch lock and the number of callers using it
+_ecfr_fetch_locks: dict[str, tuple[asyncio.Lock, int]] = {}
+
+
+@functools.cache
+def ecfr_cache_dir() -> Path:
+    """Resolve the on-disk cache directory on first use.
+
+    Raises RuntimeError when neither XDG_CACHE_HOME nor a home directory is
+    available; callers then skip the disk tier.
+    """
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "mcp-emc" / "ecfr"
+
+
+def _ecfr_cache_path(url: str) -> Path:
+    return ecfr_cache_dir() / f"{hashlib.sha1(url.encode()).hexdigest()}.txt"
+
+
+def ecfr_cache_get(url: str, max_age_s: float = ECFR_CACHE_TTL_S) -> str | None:
+    """Return a cached eCFR response younger than max_age_s, or None."""
+    now = time.time()
+    entry = _ecfr_cache.get(url)
+    if entry is not None and now - entry[0] < max_age_s:
+        _ecfr_cache.move_to_end(url)
+        return entry[1]
+
+    try:
+        path = _ecfr_cache_path(url)
+        stored_at = path.stat().st_mtime
+        if now - stored_at >= max_age_s:
+            return None
+        text = path.read_text(encoding="utf-8")
+    except (OSError, RuntimeError):
+        return None
+    _ecfr_cache_store(url, stored_at, text)
+    return text
+
+
+def _ecfr_cache_store(url: str, stored_at: float, text: str):
+    """Add an entry to the memory tier, evicting expired and then least recently used entries."""
+    _ecfr_cache[url] = (stored_at, text)
+    _ecfr_cache.move_to_end(url)
+    cutoff = time.time() - ECFR_CACHE_TTL_S
+    for key in [key for key, (ts, _) in _ecfr_cache.items() if ts <= cutoff and key != url]:
+        del _ecfr_cache[key]
+    while len(_ecfr_cache) > ECFR_CACHE_MAXSIZE:
+        _ecfr_cache.popitem(last=False)
+
+
+def ecfr_cache_put(url: str, text: str):
+    """Store an eCFR response in memory and, if writable, on disk."""
+    _ecfr_cache_store(url, time.time(), text)
+    try:
+        path = _ecfr_cache_path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except (OSError, RuntimeError):
+        pass
+
+
+@contextlib.asynccontextmanager
+async def ecfr_fetch_lock(url: str) -> AsyncIterator[None]:
+    """Hold the fetch lock for url; its entry is dropped when the last user leaves."""
+    lock, users = _ecfr_fetch_locks.get(url, (None, 0))
+    if lock is None:
+        lock = asyncio.Lock()
+    _ecfr_fetch_locks[url] = (lock, users + 1)
+    try:
+        async with lock:
+            yield
+    finally:
+        lock, users = _ecfr_fetch_locks[url]
+        if users == 1:
+            del _ecfr_fetch_locks[url]
+        else:
+            _ecfr_fetch_locks[url] = (lock, users - 1)
+
+
+def format_limit_result(limit: LimitRow, section: str = "") -> str:
+    """Format a limit entry for display."""
+    return limit.display
+
+
+def find_part15_limit(section: str, device_class: str | None, freq_mhz: float) -> LimitRow | None:
+    """Find the Part 15 limit for a section/class key, e.g. ("15.109", "A")."""
+    part15_section = PART15_SECTIONS.get(section)
+    index = part15_section.limits.get(device_class) if part15_section else None
+    if index is None:
+        return None
+    return first_in_interval_index(index, freq_mhz)
+
+
+def check_restricted_band(freq_mhz: float) -> RestrictedBand | None:
     """Check if frequency is in a restricted band."""
-    bands = RESTRICTED_BANDS.get('restricted_bands', [])
-    for band in bands:
-        if band['freq_min_mhz'] <= freq_mhz <= band['freq_max_mhz']:
-            return band
-    return None
+    return first_in_interval_index(RESTRICTED_BAND_INDEX, freq_mhz, closed=True)
 
 
-def check_ism_band(freq_mhz: float) -> dict | None:
+def check_ism_band(freq_mhz: float) -> IsmBand | None:
     """Check if frequency is in an ISM band."""
-    ism_bands = PART18_LIMITS.get('ism_bands', {}).get('bands', [])
-    for band in ism_bands:
-        range_mhz = band.get('range_mhz', [0, 0])
-        if range_mhz[0] <= freq_mhz <= range_mhz[1]:
-            return band
-    return None
+    return first_in_interval_index(ISM_BAND_INDEX, freq_mhz, closed=True)
 
 
 def find_lte_band(band_num: int) -> dict | None:
     """Find LTE band by number."""
-    bands = LTE_BANDS.get('bands', [])
-    for band in bands:
-        if band['band'] == band_num:
-            return band
-    return None
+    return LTE_BANDS_BY_NUMBER.get(band_num)
 
 
 def find_nr_band(band_name: str) -> dict | None:
     """Find NR band by name (e.g., 'n77')."""
-    band_name = band_name.lower()
-    for band in NR_BANDS.get('fr1_bands', {}).get('bands', []):
-        if band['band'].lower() == band_name:
-            return band
-    for band in NR_BANDS.get('fr2_bands', {}).get('bands', []):
-        if band['band'].lower() == band_name:
-            return band
-    return None
+    return NR_BANDS_BY_NAME.get(band_name.lower())
 
 
-def get_cispr25_limit(device_class: int, freq_mhz: float, emission_type: str = "radiated") -> dict | None:
+def get_cispr25_limit(device_class: int, freq_mhz: float, emission_type: str = "radiated") -> LimitRow | None:
     """Get CISPR 25 limit for automotive components."""
-    if emission_type == "radiated":
-        limits_data = CISPR25_LIMITS.get('radiated_emissions', {}).get('broadband', {}).get('limits', {})
-    else:
-        limits_data = CISPR25_LIMITS.get('conducted_emissions', {}).get('voltage_method', {}).get('limits', {})
-
-    class_key = f"class_{device_class}"
-    limits = limits_data.get(class_key, [])
-
-    for limit in limits:
-        if limit['freq_min_mhz'] <= freq_mhz <= limit['freq_max_mhz']:
-            return limit
+    emission_key = "radiated" if emission_type == "radiated" else "conducted"
+    index = CISPR25_LIMIT_INDEX.get((emission_key, f"class_{device_class}"))
+    if index is None:
+        return None
+    return first_in_interval_index(index, freq_mhz, closed=True)
+
+
+# Lowercased cispr_limit standard names -> CISPR_LIMITS key
+CISPR_STANDARD_KEYS = {
+    'cispr 11': 'cispr_11',
+    'cispr 22': 'cispr_32',
+    'cispr 32': 'cispr_32',
+    'cispr 14-1': 'cispr_14_1',
+}
+
+
+def _cispr_data_key(standard: str) -> str | None:
+    """Map a lowercased standard name (e.g. 'cispr 22') to its CISPR_LIMITS key."""
+    data_key = CISPR_STANDARD_KEYS.get(standard)
+    if data_key is not None:
+        return data_key
+    # Free-form names such as "CISPR32" or "EN 55032"
+    if "32" in standard or "22" in standard:
+        return 'cispr_32'
+    if "11" in standard:
+        return 'cispr_11'
+    if "14" in standard:
+        return 'cispr_14_1'
     return None
 
 
+@functools.lru_cache(maxsize=1024, typed=True)
 def get_cispr_limit(standard: str, device_class: str, freq_mhz: float, emission_type: str = "radiated") -> str:
     """Get CISPR emission limit."""
     standard = standard.lower()
     device_class = device_class.lower()
 
-    if "32" in standard or "22" in standard:
-        data = CISPR_LIMITS.get('cispr_32', {})
-    elif "11" in standard:
-        data = CISPR_LIMITS.get('cispr_11', {})
-    elif "14" in standard:
-        data = CISPR_LIMITS.get('cispr_14_1', {})
-    else:
+    data_key = _cispr_data_key(standard)
+    if data_key is None:
         return f"Unknown CISPR standard: {standard}"
 
-    class_key = f"class_{device_class}" if device_class in ['a', 'b'] else 'class_b'
-    class_data = data.get(class_key, data.get('group_1', {}).get(class_key, {}))
-
-    if not class_data:
+    class_limits = CISPR_CLASS_LIMITS[data_key, device_class if device_class in ['a', 'b'] else 'b']
+    if class_limits is None:
         return f"No data for {standard} Class {device_class.upper()}"
 
-    result = f"CISPR {standard.upper()} Class {device_class.upper()} at {freq_mhz} MHz\n{'='*50}\n\n"
+    parts = [f"CISPR {standard.upper()} Class {device_class.upper()} at {freq_mhz} MHz\n{'='*50}\n\n"]
 
     if emission_type == "radiated":
-        rad_data = class_data.get('radiated_emissions', {})
-        limits = rad_data.get('limits', [])
-        limit = find_limit_for_frequency(limits, freq_mhz)
+        limit = first_in_interval_index(class_limits.radiated, freq_mhz)
 
         if limit:
-            result += f"Radiated Emissions (@ {rad_data.get('measurement_distance_m', '?')}m):\n"
-            result += format_limit_result(limit)
+            parts.append(f"Radiated Emissions (@ {class_limits.radiated_distance_m}m):\n")
+            parts.append(format_limit_result(limit))
         else:
             # Check above 1 GHz limits
-            above_1g = rad_data.get('above_1ghz', {})
-            if above_1g and freq_mhz >= 1000:
-                limits = above_1g.get('limits', [])
-                limit = find_limit_for_frequency(limits, freq_mhz)
+            if class_limits.above_1ghz and freq_mhz >= 1000:
+                limit = first_in_interval_index(class_limits.above_1ghz, freq_mhz)
                 if limit:
-                    result += f"Radiated Emissions >1GHz (@ {above_1g.get('measurement_distance_m', '?')}m):\n"
-                    result += format_limit_result(limit)
+                    parts.append(f"Radiated Emissions >1GHz (@ {class_limits.above_1ghz_distance_m}m):\n")
+                    parts.append(format_limit_result(limit))
             else:
-                result += "No radiated limit found for this frequency"
+                parts.append("No radiated limit found for this frequency")
     else:
-        cond_data = class_data.get('conducted_emissions', {})
-        limits = cond_data.get('limits', [])
-        limit = find_limit_for_frequency(limits, freq_mhz)
+        limit = first_in_interval_index(class_limits.conducted, freq_mhz)
 
         if limit:
-            result += f"Conducted Emissions ({cond_data.get('port', 'AC mains')}):\n"
-            result += format_limit_result(limit)
+            parts.append(f"Conducted Emissions ({class_limits.conducted_port}):\n")
+            parts.append(format_limit_result(limit))
         else:
-            result += "No conducted limit found for this frequency"
+            parts.append("No conducted limit found for this frequency")
 
-    return result
+    return "".join(parts)
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    return [
-        Tool(
-            name="fcc_part15_limit",
-            description="Get FCC Part 15 emission limits for a frequency. Returns Class A and/or Class B limits for unintentional radiators (15.109), intentional radiators (15.209), or conducted emissions (15.207).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "frequency_mhz": {"type": "number", "description": "Frequency in MHz"},
-                    "section": {"type": "string", "enum": ["15.109", "15.207", "15.209", "all"], "description": "Section to query"},
-                    "device_class": {"type": "string", "enum": ["A", "B", "both"], "description": "Device class"}
-                },
-                "required": ["frequency_mhz"]
-            }
-        ),
-        Tool(
-            name="fcc_part18_limit",
-            description="Get FCC Part 18 (ISM equipment) emission limits. Check ISM bands and limits for industrial/consumer ISM equipment.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "frequency_mhz": {"type": "number", "description": "Frequency in MHz"},
-                    "equipment_type": {"type": "string", "enum": ["consumer", "industrial"], "description": "ISM equipment type"}
-                },
-                "required": ["frequency_mhz"]
-            }
-        ),
-        Tool(
-            name="fcc_restricted_bands",
-            description="Check if a frequency falls within FCC Part 15.205 restricted bands.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "frequency_mhz": {"type": "number", "description": "Frequency in MHz to check"}
-                },
-                "required": ["frequency_mhz"]
-            }
-        ),
-        Tool(
-            name="fcc_restricted_bands_list",
-            description="List all FCC Part 15.205 restricted frequency bands.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "freq_min_mhz": {"type": "number", "description": "Only show bands above this frequency"},
-                    "freq_max_mhz": {"type": "number", "description": "Only show bands below this frequency"}
-                }
-            }
-        ),
-        Tool(
-            name="ism_bands_list",
-            description="List all ISM (Industrial, Scientific, Medical) frequency bands per ITU Radio Regulations.",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="cispr_limit",
-            description="Get CISPR emission limits (CISPR 11, 22, 32, 14-1). Returns radiated or conducted limits for Class A or B.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "frequency_mhz": {"type": "number", "description": "Frequency in MHz"},
-                    "standard": {"type": "string", "enum": ["CISPR 11", "CISPR 22", "CISPR 32", "CISPR 14-1"], "description": "CISPR standard"},
-                    "device_class": {"type": "string", "enum": ["A", "B"], "description": "Device class"},
-                    "emission_type": {"type": "string", "enum": ["radiated", "conducted"], "description": "Emission type"}
-                },
-                "required": ["frequency_mhz", "standard"]
-            }
-        ),
-        Tool(
-            name="emc_compare_limits",
-            description="Compare emission limits between FCC and CISPR standards at a given frequency.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "frequency_mhz": {"type": "number", "description": "Frequency in MHz"},
-                    "device_class": {"type": "string", "enum": ["A", "B"], "description": "Device class"}
-                },
-                "required": ["frequency_mhz"]
-            }
-        ),
-        Tool(
-            name="lte_band_lookup",
-            description="Look up 3GPP LTE band information by band number. Returns frequencies, duplex mode, bandwidths.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "band": {"type": "integer", "description": "LTE band number (e.g., 7, 12, 41)"}
-                },
-                "required": ["band"]
-            }
-        ),
-        Tool(
-            name="lte_bands_list",
-            description="List all LTE bands, optionally filtered by region or carrier.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "region": {"type": "string", "description": "Filter by region (Americas, Europe, APAC, Global)"},
-                    "carrier": {"type": "string", "description": "Filter by US carrier (att, verizon, tmobile)"}
-                }
-            }
-        ),
-        Tool(
-            name="nr_band_lookup",
-            description="Look up 3GPP 5G NR band information by band name (e.g., n77, n260).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "band": {"type": "string", "description": "NR band name (e.g., 'n77', 'n260')"}
-                },
-                "required": ["band"]
-            }
-        ),
-        Tool(
-            name="nr_bands_list",
-            description="List all 5G NR bands, optionally filtered by frequency range (FR1 sub-6GHz, FR2 mmWave).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "frequency_range": {"type": "string", "enum": ["FR1", "FR2", "all"], "description": "FR1 (sub-6), FR2 (mmWave), or all"},
-                    "carrier": {"type": "string", "description": "Filter by US carrier (att, verizon, tmobile)"}
-                }
-            }
-        ),
-        Tool(
-            name="frequency_to_band",
-            description="Find which LTE/NR bands contain a given frequency.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "frequency_mhz": {"type": "number", "description": "Frequency in MHz"}
-                },
-                "required": ["frequency_mhz"]
-            }
-        ),
-        Tool(
-            name="cispr25_limit",
-            description="Get CISPR 25 automotive component emission limits. Returns limits for Classes 1-5 (1=least stringent, 5=most stringent).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "frequency_mhz": {"type": "number", "description": "Frequency in MHz"},
-                    "device_class": {"type": "integer", "enum": [1, 2, 3, 4, 5], "description": "CISPR 25 class (1-5)"},
-                    "emission_type": {"type": "string", "enum": ["radiated", "conducted"], "description": "Emission type"}
-                },
-                "required": ["frequency_mhz"]
+PART15_DEVICE_CLASSES = {"A": ("A",), "B": ("B",), "both": ("A", "B")}
+
+
+def _part15_class_block(section: str, freq_mhz: float, device_class: str) -> str:
+    """Render a Part 15 section that has per-device-class limits."""
+    part15_section = PART15_SECTIONS[section]
+    lines = [part15_section.header]
+    for class_key in PART15_DEVICE_CLASSES.get(device_class, ()):
+        limit = find_part15_limit(section, class_key, freq_mhz)
+        if limit:
+            lines.append(part15_section.class_headers[class_key])
+            lines.append(format_limit_result(limit))
+    return "\n".join(lines)
+
+
+def _part15_15_109_block(freq_mhz: float, device_class: str) -> str | None:
+    return _part15_class_block("15.109", freq_mhz, device_class)
+
+
+def _part15_15_207_block(freq_mhz: float, device_class: str) -> str | None:
+    # Conducted limits only apply up to 30 MHz
+    if freq_mhz <= 30:
+        return _part15_class_block("15.207", freq_mhz, device_class)
+    return None
+
+
+def _part15_15_209_block(freq_mhz: float, device_class: str) -> str | None:
+    lines = [PART15_SECTIONS["15.209"].header]
+    limit = find_part15_limit("15.209", None, freq_mhz)
+    if limit:
+        lines.append(format_limit_result(limit))
+    return "\n".join(lines)
+
+
+# Section renderers for fcc_part15_limit, in "all" output order; None means skipped
+PART15_SECTION_RENDERERS: dict[str, Callable[[float, str], str | None]] = {
+    "15.109": _part15_15_109_block,
+    "15.207": _part15_15_207_block,
+    "15.209": _part15_15_209_block,
+}
+
+
+@functools.lru_cache(maxsize=2048, typed=True)
+def _fcc_part15_limit_text(freq_mhz: float, section: str, device_class: str) -> str:
+    """Render the fcc_part15_limit response."""
+    results = [f"FCC Part 15 Limits at {freq_mhz} MHz\n{'='*40}"]
+
+    if section == "all":
+        renderers = PART15_SECTION_RENDERERS.values()
+    else:
+        renderer = PART15_SECTION_RENDERERS.get(section)
+        renderers = (renderer,) if renderer else ()
+    for renderer in renderers:
+        block = renderer(freq_mhz, device_class)
+        if block is not None:
+            results.append(block)
+
+    restricted = check_restricted_band(freq_mhz)
+    if restricted:
+        results.append(f"\n⚠️  WARNING: {freq_mhz} MHz is in a RESTRICTED BAND (15.205)")
+        results.append(restricted.warning_line)
+
+    return "\n".join(results)
+
+
+# One pre-rendered list row per restricted band, in source-list order
+RESTRICTED_BAND_ROWS = tuple(
+    f"  {band.freq_min_mhz:>10.4f} - {band.freq_max_mhz:<10.4f} MHz  |  {band.service}\n"
+    for band in RESTRICTED_BAND_INDEX.rows
+)
+RESTRICTED_BANDS_LIST_HEADER = f"FCC Part 15.205 Restricted Bands ({{count}} bands)\n{'='*50}\n\n"
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _fcc_restricted_bands_list_text(freq_min: float, freq_max: float) -> str:
+    """Render the fcc_restricted_bands_list response."""
+    positions = overlapping_interval_positions(RESTRICTED_BAND_INDEX, freq_min, freq_max)
+    rows = RESTRICTED_BAND_ROWS
+    return RESTRICTED_BANDS_LIST_HEADER.format(count=len(positions)) + "".join([rows[pos] for pos in positions])
+
+
+def _restricted_bands_full_list_text() -> str | None:
+    """Render the list covering every restricted band (None if there are none)."""
+    if not RESTRICTED_BAND_INDEX.mins:
+        return None
+    return _fcc_restricted_bands_list_text(RESTRICTED_BAND_INDEX.mins[0], RESTRICTED_BAND_INDEX.reach[-1])
+
+
+RESTRICTED_BANDS_FULL_LIST_TEXT = _restricted_bands_full_list_text()
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _nr_band_lookup_text(band_name: str) -> str:
+    """Render the nr_band_lookup response."""
+    band = find_nr_band(band_name)
+
+    if band:
+        parts = [f"5G NR Band {band['band']} ({band.get('name', 'Unknown')})\n{'='*40}\n\n"]
+
+        if 'uplink_mhz' in band:
+            parts.append(f"Uplink:   {band['uplink_mhz'][0]} - {band['uplink_mhz'][1]} MHz\n")
+            parts.append(f"Downlink: {band['downlink_mhz'][0]} - {band['downlink_mhz'][1]} MHz\n")
+        elif 'range_mhz' in band:
+            parts.append(f"Range:    {band['range_mhz'][0]} - {band['range_mhz'][1]} MHz\n")
+
+        parts.append(f"Duplex:   {band.get('duplex', 'Unknown')}\n")
+        parts.append(f"Max BW:   {band.get('max_bandwidth_mhz', '?')} MHz\n")
+
+        if 'notes' in band:
+            parts.append(f"Notes:    {band['notes']}\n")
+    else:
+        parts = [f"NR Band '{band_name}' not found. Use format 'n77', 'n260', etc."]
+
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _frequency_to_band_text(freq_mhz: float) -> str:
+    """Render the frequency_to_band response."""
+    found = [label for _, _, label in stab_segment_table(CELLULAR_BAND_SEGMENTS, freq_mhz)]
+
+    parts = [f"Bands containing {freq_mhz} MHz\n{'='*40}\n\n"]
+    if found:
+        for b in found:
+            parts.append(f"  - {b}\n")
+    else:
+        parts.append("  No LTE/NR bands found for this frequency.\n")
+
+    # Also check ISM
+    ism = check_ism_band(freq_mhz)
+    if ism:
+        parts.append(f"\n  ISM Band: {ism.center_mhz} MHz center\n")
+
+    return "".join(parts)
+
+
+def _ism_bands_list_text() -> str:
+    """Render the ism_bands_list response."""
+    parts = [f"ISM Frequency Bands (ITU Radio Regulations)\n{'='*50}\n\n"]
+
+    for band in ISM_BAND_INDEX.rows:
+        parts.append(f"  {band.center_mhz:>8} MHz  ({band.range_mhz[0]}-{band.range_mhz[1]} MHz)")
+        if band.notes is not None:
+            parts.append(f"  [{band.notes}]")
+        parts.append("\n")
+
+    return "".join(parts)
+
+
+ISM_BANDS_LIST_TEXT = _ism_bands_list_text()
+
+EMC_STANDARDS_TEXT = """\
+Available EMC Standards and Regulations
+=============================================
+
+## FCC (United States)
+  ✓ Part 15.109 - Radiated emissions (unintentional)
+  ✓ Part 15.207 - Conducted emissions
+  ✓ Part 15.209 - Radiated emissions (intentional)
+  ✓ Part 15.205 - Restricted frequency bands
+  ✓ Part 18 - ISM equipment
+
+## CISPR (International)
+  ✓ CISPR 11 - Industrial, scientific, medical equipment
+  ✓ CISPR 32 - Multimedia equipment (replaces CISPR 22)
+  ✓ CISPR 14-1 - Household appliances
+
+## Automotive EMC
+  ✓ CISPR 25 - Component emissions (Classes 1-5)
+  ✓ CISPR 12 - Vehicle-level emissions
+  ✓ ISO 11452-2 - Radiated immunity
+  ✓ ISO 7637-2 - Conducted transients
+
+## Cellular (3GPP)
+  ✓ LTE bands (E-UTRA)
+  ✓ 5G NR bands (FR1 + FR2)
+  ✓ US carrier band info (AT&T, Verizon, T-Mobile)
+
+## Coming Soon
+  - IEC 60601-1-2 - Medical devices
+  - PTCRB certification requirements
+"""
+
+
+# Tool schemas are static, so build them once
+TOOLS: list[Tool] = [
+    Tool(
+        name="fcc_part15_limit",
+        description="Get FCC Part 15 emission limits for a frequency. Returns Class A and/or Class B limits for unintentional radiators (15.109), intentional radiators (15.209), or conducted emissions (15.207).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "frequency_mhz": {"type": "number", "description": "Frequency in MHz"},
+                "section": {"type": "string", "enum": ["15.109", "15.207", "15.209", "all"], "description": "Section to query"},
+                "device_class": {"type": "string", "enum": ["A", "B", "both"], "description": "Device class"}
+            },
+            "required": ["frequency_mhz"]
+        }
+    ),
+    Tool(
+        name="fcc_part18_limit",
+        description="Get FCC Part 18 (ISM equipment) emission limits. Check ISM bands and limits for industrial/consumer ISM equipment.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "frequency_mhz": {"type": "number", "description": "Frequency in MHz"},
+                "equipment_type": {"type": "string", "enum": ["consumer", "industrial"], "description": "ISM equipment type"}
+            },
+            "required": ["frequency_mhz"]
+        }
+    ),
+    Tool(
+        name="fcc_restricted_bands",
+        description="Check if a frequency falls within FCC Part 15.205 restricted bands.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "frequency_mhz": {"type": "number", "description": "Frequency in MHz to check"}
+            },
+            "required": ["frequency_mhz"]
+        }
+    ),
+    Tool(
+        name="fcc_restricted_bands_list",
+        description="List all FCC Part 15.205 restricted frequency bands.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "freq_min_mhz": {"type": "number", "description": "Only show bands above this frequency"},
+                "freq_max_mhz": {"type": "number", "description": "Only show bands below this frequency"}
             }
-        ),
-        Tool(
-            name="cispr12_limit",
-            description="Get CISPR 12 vehicle-level emission limits for type approval.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "frequency_mhz": {"type": "number", "description": "Frequency in MHz"}
-                },
-                "required": ["frequency_mhz"]
+        }
+    ),
+    Tool(
+        name="ism_bands_list",
+        description="List all ISM (Industrial, Scientific, Medical) frequency bands per ITU Radio Regulations.",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    Tool(
+        name="cispr_limit",
+        description="Get CISPR emission limits (CISPR 11, 22, 32, 14-1). Returns radiated or conducted limits for Class A or B.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "frequency_mhz": {"type": "number", "description": "Frequency in MHz"},
+                "standard": {"type": "string", "enum": ["CISPR 11", "CISPR 22", "CISPR 32", "CISPR 14-1"], "description": "CISPR standard"},
+                "device_class": {"type": "string", "enum": ["A", "B"], "description": "Device class"},
+                "emission_type": {"type": "string", "enum": ["radiated", "conducted"], "description": "Emission type"}
+            },
+            "required": ["frequency_mhz", "standard"]
+        }
+    ),
+    Tool(
+        name="emc_compare_limits",
+        description="Compare emission limits between FCC and CISPR standards at a given frequency.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "frequency_mhz": {"type": "number", "description": "Frequency in MHz"},
+                "device_class": {"type": "string", "enum": ["A", "B"], "description": "Device class"}
+            },
+            "required": ["frequency_mhz"]
+        }
+    ),
+    Tool(
+        name="lte_band_lookup",
+        description="Look up 3GPP LTE band information by band number. Returns frequencies, duplex mode, bandwidths.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "band": {"type": "integer", "description": "LTE band number (e.g., 7, 12, 41)"}
+            },
+            "required": ["band"]
+        }
+    ),
+    Tool(
+        name="lte_bands_list",
+        description="List all LTE bands, optionally filtered by region or carrier.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {"type": "string", "description": "Filter by region (Americas, Europe, APAC, Global)"},
+                "carrier": {"type": "string", "description": "Filter by US carrier (att, verizon, tmobile)"}
             }
-        ),
-        Tool(
-            name="iso11452_levels",
-            description="Get ISO 11452-2 radiated immunity test levels for automotive components.",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="iso7637_pulses",
-            description="Get ISO 7637-2 conducted transient immunity test pulses for automotive components.",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="automotive_emc_overview",
-            description="Get an overview of automotive EMC standards (CISPR 12, CISPR 25, ISO 11452, ISO 7637, UNECE R10).",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="emc_standards_list",
-            description="List all available EMC standards and regulations in the database.",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="ecfr_query",
-            description="Query the eCFR API for specific CFR sections.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "integer", "description": "CFR title (47 for FCC)"},
-                    "part": {"type": "integer", "description": "CFR part (15, 18, etc.)"},
-                    "section": {"type": "string", "description": "Section number (e.g., '15.209')"}
-                },
-                "required": ["title", "part"]
+        }
+    ),
+    Tool(
+        name="nr_band_lookup",
+        description="Look up 3GPP 5G NR band information by band name (e.g., n77, n260).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "band": {"type": "string", "description": "NR band name (e.g., 'n77', 'n260')"}
+            },
+            "required": ["band"]
+        }
+    ),
+    Tool(
+        name="nr_bands_list",
+        description="List all 5G NR bands, optionally filtered by frequency range (FR1 sub-6GHz, FR2 mmWave).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "frequency_range": {"type": "string", "enum": ["FR1", "FR2", "all"], "description": "FR1 (sub-6), FR2 (mmWave), or all"},
+                "carrier": {"type": "string", "description": "Filter by US carrier (att, verizon, tmobile)"}
             }
-        )
-    ]
+        }
+    ),
+    Tool(
+        name="frequency_to_band",
+        description="Find which LTE/NR bands contain a given frequency.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "frequency_mhz": {"type": "number", "description": "Frequency in MHz"}
+            },
+            "required": ["frequency_mhz"]
+        }
+    ),
+    Tool(
+        name="cispr25_limit",
+        description="Get CISPR 25 automotive component emission limits. Returns limits for Classes 1-5 (1=least stringent, 5=most stringent).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "frequency_mhz": {"type": "number", "description": "Frequency in MHz"},
+                "device_class": {"type": "integer", "enum": [1, 2, 3, 4, 5], "description": "CISPR 25 class (1-5)"},
+                "emission_type": {"type": "string", "enum": ["radiated", "conducted"], "description": "Emission type"}
+            },
+            "required": ["frequency_mhz"]
+        }
+    ),
+    Tool(
+        name="cispr12_limit",
+        description="Get CISPR 12 vehicle-level emission limits for type approval.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "frequency_mhz": {"type": "number", "description": "Frequency in MHz"}
+            },
+            "required": ["frequency_mhz"]
+        }
+    ),
+    Tool(
+        name="iso11452_levels",
+        description="Get ISO 11452-2 radiated immunity test levels for automotive components.",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    Tool(
+        name="iso7637_pulses",
+        description="Get ISO 7637-2 conducted transient immunity test pulses for automotive components.",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    Tool(
+        name="automotive_emc_overview",
+        description="Get an overview of automotive EMC standards (CISPR 12, CISPR 25, ISO 11452, ISO 7637, UNECE R10).",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    Tool(
+        name="emc_standards_list",
+        description="List all available EMC standards and regulations in the database.",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    Tool(
+        name="ecfr_query",
+        description="Query the eCFR API for specific CFR sections.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "integer", "description": "CFR title (47 for FCC)"},
+                "part": {"type": "integer", "description": "CFR part (15, 18, etc.)"},
+                "section": {"type": "string", "description": "Section number (e.g., '15.209')"}
+            },
+            "required": ["title", "part"]
+        }
+    )
+]
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """Return the shared module-level tool list; MCP serializes it without mutating."""
+    return TOOLS
 
-    if name == "fcc_part15_limit":
-        freq_mhz = arguments["frequency_mhz"]
-        section = arguments.get("section", "all")
-        device_class = arguments.get("device_class", "both")
 
-        results = [f"FCC Part 15 Limits at {freq_mhz} MHz\n{'='*40}"]
+async def _handle_fcc_part15_limit(arguments: dict[str, Any]) -> str:
+    freq_mhz = arguments["frequency_mhz"]
+    section = arguments.get("section", "all")
+    device_class = arguments.get("device_class", "both")
+    return _fcc_part15_limit_text(freq_mhz, section, device_class)
 
-        if section in ["15.109", "all"]:
-            sec_data = PART15_LIMITS.get("section_15_109", {})
-            results.append(f"\n## Section 15.109 - {sec_data.get('title', 'Radiated Emission Limits')}")
 
-            if device_class in ["A", "both"]:
-                class_a = sec_data.get("class_a", {})
-                limit = find_limit_for_frequency(class_a.get("limits", []), freq_mhz)
-                if limit:
-                    results.append(f"\nClass A ({class_a.get('description', 'Commercial')}):")
-                    results.append(format_limit_result(limit))
+async def _handle_fcc_part18_limit(arguments: dict[str, Any]) -> str:
+    freq_mhz = arguments["frequency_mhz"]
+    eq_type = arguments.get("equipment_type", "consumer")
 
-            if device_class in ["B", "both"]:
-                class_b = sec_data.get("class_b", {})
-                limit = find_limit_for_frequency(class_b.get("limits", []), freq_mhz)
-                if limit:
-                    results.append(f"\nClass B ({class_b.get('description', 'Residential')}):")
-                    results.append(format_limit_result(limit))
+    parts = [f"FCC Part 18 (ISM Equipment) at {freq_mhz} MHz\n{'='*50}\n\n"]
 
-        if section in ["15.207", "all"] and freq_mhz <= 30:
-            sec_data = PART15_LIMITS.get("section_15_207", {})
-            results.append(f"\n## Section 15.207 - {sec_data.get('title', 'Conducted Limits')}")
+    ism_band = check_ism_band(freq_mhz)
+    if ism_band:
+        parts.append(f"✓ WITHIN ISM BAND\n")
+        parts.append(f"  Center: {ism_band.center_mhz} MHz\n")
+        parts.append(f"  Range: {ism_band.range_mhz[0]} - {ism_band.range_mhz[1]} MHz\n")
+        if ism_band.notes is not None:
+            parts.append(f"  Notes: {ism_band.notes}\n")
+        parts.append(f"\n  Fundamental emissions: No limit within ISM band\n")
+    else:
+        parts.append(f"✗ OUTSIDE ISM BANDS\n")
+        parts.append(f"  Standard emission limits apply (same as Part 15.209)\n\n")
 
-            if device_class in ["A", "both"]:
-                limit = find_limit_for_frequency(sec_data.get("class_a", {}).get("limits", []), freq_mhz)
-                if limit:
-                    results.append("\nClass A:")
-                    results.append(format_limit_result(limit))
+    index = PART18_LIMIT_INDEX.get(eq_type)
+    limit = first_in_interval_index(index, freq_mhz) if index else None
 
-            if device_class in ["B", "both"]:
-                limit = find_limit_for_frequency(sec_data.get("class_b", {}).get("limits", []), freq_mhz)
-                if limit:
-                    results.append("\nClass B:")
-                    results.append(format_limit_result(limit))
-
-        if section in ["15.209", "all"]:
-            sec_data = PART15_LIMITS.get("section_15_209", {})
-            results.append(f"\n## Section 15.209 - {sec_data.get('title', 'Intentional Radiators')}")
-            limit = find_limit_for_frequency(sec_data.get("limits", []), freq_mhz)
-            if limit:
-                results.append(format_limit_result(limit))
-
-        restricted = check_restricted_band(freq_mhz)
-        if restricted:
-            results.append(f"\n⚠️  WARNING: {freq_mhz} MHz is in a RESTRICTED BAND (15.205)")
-            results.append(f"   {restricted['freq_min_mhz']} - {restricted['freq_max_mhz']} MHz: {restricted['service']}")
-
-        return [TextContent(type="text", text="\n".join(results))]
-
-    elif name == "fcc_part18_limit":
-        freq_mhz = arguments["frequency_mhz"]
-        eq_type = arguments.get("equipment_type", "consumer")
-
-        result = f"FCC Part 18 (ISM Equipment) at {freq_mhz} MHz\n{'='*50}\n\n"
-
-        ism_band = check_ism_band(freq_mhz)
-        if ism_band:
-            result += f"✓ WITHIN ISM BAND\n"
-            result += f"  Center: {ism_band['center_mhz']} MHz\n"
-            result += f"  Range: {ism_band['range_mhz'][0]} - {ism_band['range_mhz'][1]} MHz\n"
-            if 'notes' in ism_band:
-                result += f"  Notes: {ism_band['notes']}\n"
-            result += f"\n  Fundamental emissions: No limit within ISM band\n"
-        else:
-            result += f"✗ OUTSIDE ISM BANDS\n"
-            result += f"  Standard emission limits apply (same as Part 15.209)\n\n"
+    if limit:
+        parts.append(f"\nLimits outside ISM bands ({eq_type.title()} ISM):\n")
+        parts.append(format_limit_result(limit))
 
-        sec_data = PART18_LIMITS.get("section_18_305", {})
-        eq_data = sec_data.get(f"{eq_type}_ism", {})
-        limits = eq_data.get("emissions_outside_ism", [])
-        limit = find_limit_for_frequency(limits, freq_mhz)
+    return "".join(parts)
 
-        if limit:
-            result += f"\nLimits outside ISM bands ({eq_type.title()} ISM):\n"
-            result += format_limit_result(limit)
 
-        return [TextContent(type="text", text=result)]
+async def _handle_fcc_restricted_bands(arguments: dict[str, Any]) -> str:
+    freq_mhz = arguments["frequency_mhz"]
+    restricted = check_restricted_band(freq_mhz)
 
-    elif name == "fcc_restricted_bands":
-        freq_mhz = arguments["frequency_mhz"]
-        restricted = check_restricted_band(freq_mhz)
+    if restricted:
+        parts = [f"⚠️  RESTRICTED BAND\n\n"]
+        parts.append(f"Frequency {freq_mhz} MHz falls within a restricted band per 47 CFR 15.205:\n\n")
+        parts.append(restricted.detail_text)
+        parts.append("Intentional radiators are generally prohibited from operating in this band.")
+    else:
+        parts = [f"✓ CLEAR\n\nFrequency {freq_mhz} MHz is NOT in a restricted band."]
 
-        if restricted:
-            result = f"⚠️  RESTRICTED BAND\n\n"
-            result += f"Frequency {freq_mhz} MHz falls within a restricted band per 47 CFR 15.205:\n\n"
-            result += f"  Band: {restricted['freq_min_mhz']} - {restricted['freq_max_mhz']} MHz\n"
-            result += f"  Protected Service: {restricted['service']}\n\n"
-            result += "Intentional radiators are generally prohibited from operating in this band."
-        else:
-            result = f"✓ CLEAR\n\nFrequency {freq_mhz} MHz is NOT in a restricted band."
+    return "".join(parts)
 
-        return [TextContent(type="text", text=result)]
 
-    elif name == "fcc_restricted_bands_list":
-        freq_min = arguments.get("freq_min_mhz", 0)
-        freq_max = arguments.get("freq_max_mhz", float('inf'))
+async def _handle_fcc_restricted_bands_list(arguments: dict[str, Any]) -> str:
+    freq_min = arguments.get("freq_min_mhz", 0)
+    freq_max = arguments.get("freq_max_mhz", float('inf'))
+    # A range spanning every band (including the defaults) renders the full list
+    if (
+        RESTRICTED_BANDS_FULL_LIST_TEXT is not None
+        and freq_min <= RESTRICTED_BAND_INDEX.mins[0]
+        and freq_max >= RESTRICTED_BAND_INDEX.reach[-1]
+    ):
+        return RESTRICTED_BANDS_FULL_LIST_TEXT
+    return _fcc_restricted_bands_list_text(freq_min, freq_max)
 
-        bands = RESTRICTED_BANDS.get('restricted_bands', [])
-        filtered = [b for b in bands if b['freq_max_mhz'] >= freq_min and b['freq_min_mhz'] <= freq_max]
 
-        result = f"FCC Part 15.205 Restricted Bands ({len(filtered)} bands)\n{'='*50}\n\n"
-        for band in filtered:
-            result += f"  {band['freq_min_mhz']:>10.4f} - {band['freq_max_mhz']:<10.4f} MHz  |  {band['service']}\n"
+async def _handle_ism_bands_list(arguments: dict[str, Any]) -> str:
+    return ISM_BANDS_LIST_TEXT
 
-        return [TextContent(type="text", text=result)]
 
-    elif name == "ism_bands_list":
-        ism_bands = PART18_LIMITS.get('ism_bands', {}).get('bands', [])
-        result = f"ISM Frequency Bands (ITU Radio Regulations)\n{'='*50}\n\n"
+async def _handle_cispr_limit(arguments: dict[str, Any]) -> str:
+    freq_mhz = arguments["frequency_mhz"]
+    standard = arguments["standard"]
+    device_class = arguments.get("device_class", "B")
+    emission_type = arguments.get("emission_type", "radiated")
 
-        for band in ism_bands:
-            result += f"  {band['center_mhz']:>8} MHz  ({band['range_mhz'][0]}-{band['range_mhz'][1]} MHz)"
-            if 'notes' in band:
-                result += f"  [{band['notes']}]"
-            result += "\n"
+    result = get_cispr_limit(standard, device_class, freq_mhz, emission_type)
+    return result
 
-        return [TextContent(type="text", text=result)]
 
-    elif name == "cispr_limit":
-        freq_mhz = arguments["frequency_mhz"]
-        standard = arguments["standard"]
-        device_class = arguments.get("device_class", "B")
-        emission_type = arguments.get("emission_type", "radiated")
+async def _handle_emc_compare_limits(arguments: dict[str, Any]) -> str:
+    freq_mhz = arguments["frequency_mhz"]
+    device_class = arguments.get("device_class", "B").upper()
 
-        result = get_cispr_limit(standard, device_class, freq_mhz, emission_type)
-        return [TextContent(type="text", text=result)]
+    parts = [f"EMC Limit Comparison at {freq_mhz} MHz (Class {device_class})\n{'='*55}\n\n"]
 
-    elif name == "emc_compare_limits":
-        freq_mhz = arguments["frequency_mhz"]
-        device_class = arguments.get("device_class", "B").upper()
+    # FCC Part 15.109
+    fcc_limit = find_part15_limit("15.109", device_class, freq_mhz)
 
-        result = f"EMC Limit Comparison at {freq_mhz} MHz (Class {device_class})\n{'='*55}\n\n"
+    if fcc_limit:
+        parts.append(f"FCC Part 15.109 Class {device_class}:\n")
+        parts.append(f"  {fcc_limit.limit_dbuv_m} dBuV/m @ {fcc_limit.distance_m}m (QP)\n\n")
 
-        # FCC Part 15.109
-        fcc_data = PART15_LIMITS.get("section_15_109", {}).get(f"class_{device_class.lower()}", {})
-        fcc_limit = find_limit_for_frequency(fcc_data.get("limits", []), freq_mhz)
+    # CISPR 32
+    cispr_class = CISPR_CLASS_LIMITS.get(('cispr_32', device_class.lower()))
+    cispr_limit = first_in_interval_index(cispr_class.radiated, freq_mhz) if cispr_class else None
 
-        if fcc_limit:
-            result += f"FCC Part 15.109 Class {device_class}:\n"
-            result += f"  {fcc_limit['limit_dbuv_m']} dBuV/m @ {fcc_limit['distance_m']}m (QP)\n\n"
+    if cispr_limit:
+        parts.append(f"CISPR 32 Class {device_class}:\n")
+        parts.append(f"  {cispr_limit.limit_dbuv_m} dBuV/m @ {cispr_class.radiated_distance_m}m (QP)\n\n")
 
-        # CISPR 32
-        cispr_data = CISPR_LIMITS.get('cispr_32', {}).get(f"class_{device_class.lower()}", {})
-        cispr_rad = cispr_data.get('radiated_emissions', {})
-        cispr_limit = find_limit_for_frequency(cispr_rad.get('limits', []), freq_mhz)
+    # Distance correction note
+    if fcc_limit and cispr_limit:
+        parts.append("Note: FCC uses 3m, CISPR uses 10m measurement distance.\n")
+        parts.append("Distance correction: +10.5 dB to convert 10m→3m limits.\n")
+        cispr_at_3m = cispr_limit.limit_dbuv_m + 10.5
+        parts.append(f"CISPR 32 at 3m (calculated): {cispr_at_3m:.1f} dBuV/m\n")
 
-        if cispr_limit:
-            result += f"CISPR 32 Class {device_class}:\n"
-            result += f"  {cispr_limit['limit_dbuv_m']} dBuV/m @ {cispr_rad.get('measurement_distance_m', 10)}m (QP)\n\n"
+    return "".join(parts)
 
-        # Distance correction note
-        if fcc_limit and cispr_limit:
-            result += "Note: FCC uses 3m, CISPR uses 10m measurement distance.\n"
-            result += "Distance correction: +10.5 dB to convert 10m→3m limits.\n"
-            cispr_at_3m = cispr_limit['limit_dbuv_m'] + 10.5
-            result += f"CISPR 32 at 3m (calculated): {cispr_at_3m:.1f} dBuV/m\n"
 
-        return [TextContent(type="text", text=result)]
+async def _handle_lte_band_lookup(arguments: dict[str, Any]) -> str:
+    band_num = arguments["band"]
+    band = find_lte_band(band_num)
 
-    elif name == "lte_band_lookup":
-        band_num = arguments["band"]
-        band = find_lte_band(band_num)
+    if band:
+        parts = [f"LTE Band {band_num} ({band.get('name', 'Unknown')})\n{'='*40}\n\n"]
 
-        if band:
-            result = f"LTE Band {band_num} ({band.get('name', 'Unknown')})\n{'='*40}\n\n"
+        if band.get('uplink_mhz'):
+            parts.append(f"Uplink:   {band['uplink_mhz'][0]} - {band['uplink_mhz'][1]} MHz\n")
+        if band.get('downlink_mhz'):
+            parts.append(f"Downlink: {band['downlink_mhz'][0]} - {band['downlink_mhz'][1]} MHz\n")
 
-            if band.get('uplink_mhz'):
-                result += f"Uplink:   {band['uplink_mhz'][0]} - {band['uplink_mhz'][1]} MHz\n"
-            if band.get('downlink_mhz'):
-                result += f"Downlink: {band['downlink_mhz'][0]} - {band['downlink_mhz'][1]} MHz\n"
+        parts.append(f"Duplex:   {band.get('duplex', 'Unknown')}\n")
+        parts.append(f"Bandwidths: {', '.join(str(b) for b in band.get('bandwidth_mhz', []))} MHz\n")
+        parts.append(f"Regions:  {', '.join(band.get('regions', []))}\n")
 
-            result += f"Duplex:   {band.get('duplex', 'Unknown')}\n"
-            result += f"Bandwidths: {', '.join(str(b) for b in band.get('bandwidth_mhz', []))} MHz\n"
-            result += f"Regions:  {', '.join(band.get('regions', []))}\n"
+        if 'notes' in band:
+            parts.append(f"Notes:    {band['notes']}\n")
+    else:
+        parts = [f"LTE Band {band_num} not found in database."]
 
-            if 'notes' in band:
-                result += f"Notes:    {band['notes']}\n"
-        else:
-            result = f"LTE Band {band_num} not found in database."
+    return "".join(parts)
 
-        return [TextContent(type="text", text=result)]
 
-    elif name == "lte_bands_list":
-        region = arguments.get("region", "").lower()
-        carrier = arguments.get("carrier", "").lower()
+async def _handle_lte_bands_list(arguments: dict[str, Any]) -> str:
+    region = arguments.get("region", "").lower()
+    carrier = arguments.get("carrier", "").lower()
 
-        if carrier:
-            carrier_bands = LTE_BANDS.get('us_carrier_bands', {}).get(carrier, {})
-            if carrier_bands:
-                result = f"LTE Bands for {carrier.upper()}\n{'='*40}\n\n"
-                result += f"Primary bands: {', '.join(str(b) for b in carrier_bands.get('primary', []))}\n"
-                result += f"LTE-M bands:   {', '.join(str(b) for b in carrier_bands.get('lte_m', []))}\n"
-            else:
-                result = f"Carrier '{carrier}' not found. Available: att, verizon, tmobile"
+    if carrier:
+        carrier_bands = LTE_BANDS.get('us_carrier_bands', {}).get(carrier, {})
+        if carrier_bands:
+            parts = [f"LTE Bands for {carrier.upper()}\n{'='*40}\n\n"]
+            parts.append(f"Primary bands: {', '.join(str(b) for b in carrier_bands.get('primary', []))}\n")
+            parts.append(f"LTE-M bands:   {', '.join(str(b) for b in carrier_bands.get('lte_m', []))}\n")
         else:
-            bands = LTE_BANDS.get('bands', [])
-            if region:
-                bands = [b for b in bands if region in [r.lower() for r in b.get('regions', [])]]
+            parts = [f"Carrier '{carrier}' not found. Available: att, verizon, tmobile"]
+    else:
+        bands = LTE_BANDS.get('bands', [])
+        if region:
+            bands = LTE_BANDS_BY_REGION.get(region, [])
 
-            result = f"LTE Bands{' (' + region.title() + ')' if region else ''}\n{'='*50}\n\n"
-            for band in bands[:30]:  # Limit output
-                ul = band.get('uplink_mhz', [0, 0])
-                dl = band.get('downlink_mhz', [0, 0])
-                result += f"Band {band['band']:>2}: {dl[0]:>4}-{dl[1]:<4} MHz ({band['duplex']}) {band.get('name', '')}\n"
+        parts = [f"LTE Bands{' (' + region.title() + ')' if region else ''}\n{'='*50}\n\n"]
+        for band in bands[:30]:  # Limit output
+            ul = band.get('uplink_mhz', [0, 0])
+            dl = band.get('downlink_mhz', [0, 0])
+            parts.append(f"Band {band['band']:>2}: {dl[0]:>4}-{dl[1]:<4} MHz ({band['duplex']}) {band.get('name', '')}\n")
 
-        return [TextContent(type="text", text=result)]
+    return "".join(parts)
 
-    elif name == "nr_band_lookup":
-        band_name = arguments["band"]
-        band = find_nr_band(band_name)
 
-        if band:
-            result = f"5G NR Band {band['band']} ({band.get('name', 'Unknown')})\n{'='*40}\n\n"
+async def _handle_nr_band_lookup(arguments: dict[str, Any]) -> str:
+    band_name = arguments["band"]
+    return _nr_band_lookup_text(band_name)
 
-            if 'uplink_mhz' in band:
-                result += f"Uplink:   {band['uplink_mhz'][0]} - {band['uplink_mhz'][1]} MHz\n"
-                result += f"Downlink: {band['downlink_mhz'][0]} - {band['downlink_mhz'][1]} MHz\n"
-            elif 'range_mhz' in band:
-                result += f"Range:    {band['range_mhz'][0]} - {band['range_mhz'][1]} MHz\n"
 
-            result += f"Duplex:   {band.get('duplex', 'Unknown')}\n"
-            result += f"Max BW:   {band.get('max_bandwidth_mhz', '?')} MHz\n"
+async def _handle_nr_bands_list(arguments: dict[str, Any]) -> str:
+    freq_range = arguments.get("frequency_range", "all").upper()
+    carrier = arguments.get("carrier", "").lower()
 
-            if 'notes' in band:
-                result += f"Notes:    {band['notes']}\n"
+    if carrier:
+        carrier_bands = NR_BANDS.get('us_carrier_nr_bands', {}).get(carrier, {})
+        if carrier_bands:
+            parts = [f"5G NR Bands for {carrier.upper()}\n{'='*40}\n\n"]
+            parts.append(f"Low-band:  {', '.join(carrier_bands.get('low_band', []))}\n")
+            parts.append(f"Mid-band:  {', '.join(carrier_bands.get('mid_band', []))}\n")
+            parts.append(f"mmWave:    {', '.join(carrier_bands.get('mmwave', []))}\n")
+            if 'notes' in carrier_bands:
+                parts.append(f"Notes:     {carrier_bands['notes']}\n")
         else:
-            result = f"NR Band '{band_name}' not found. Use format 'n77', 'n260', etc."
-
-        return [TextContent(type="text", text=result)]
-
-    elif name == "nr_bands_list":
-        freq_range = arguments.get("frequency_range", "all").upper()
-        carrier = arguments.get("carrier", "").lower()
-
-        if carrier:
-            carrier_bands = NR_BANDS.get('us_carrier_nr_bands', {}).get(carrier, {})
-            if carrier_bands:
-                result = f"5G NR Bands for {carrier.upper()}\n{'='*40}\n\n"
-                result += f"Low-band:  {', '.join(carrier_bands.get('low_band', []))}\n"
-                result += f"Mid-band:  {', '.join(carrier_bands.get('mid_band', []))}\n"
-                result += f"mmWave:    {', '.join(carrier_bands.get('mmwave', []))}\n"
-                if 'notes' in carrier_bands:
-                    result += f"Notes:     {carrier_bands['notes']}\n"
-            else:
-                result = f"Carrier '{carrier}' not found."
-        else:
-            result = f"5G NR Bands\n{'='*50}\n\n"
-
-            if freq_range in ["FR1", "ALL"]:
-                result += "## FR1 (Sub-6 GHz)\n"
-                for band in NR_BANDS.get('fr1_bands', {}).get('bands', []):
-                    if 'uplink_mhz' in band:
-                        result += f"  {band['band']:>4}: {band['uplink_mhz'][0]:>4}-{band['uplink_mhz'][1]:<4} MHz ({band['duplex']}) {band.get('name', '')}\n"
-
-            if freq_range in ["FR2", "ALL"]:
-                result += "\n## FR2 (mmWave)\n"
-                for band in NR_BANDS.get('fr2_bands', {}).get('bands', []):
-                    result += f"  {band['band']:>4}: {band['range_mhz'][0]:>5}-{band['range_mhz'][1]:<5} MHz {band.get('name', '')}\n"
-
-        return [TextContent(type="text", text=result)]
-
-    elif name == "frequency_to_band":
-        freq_mhz = arguments["frequency_mhz"]
-        found = []
-
-        # Check LTE bands
-        for band in LTE_BANDS.get('bands', []):
-            ul = band.get('uplink_mhz')
-            dl = band.get('downlink_mhz')
-            if ul and ul[0] <= freq_mhz <= ul[1]:
-                found.append(f"LTE Band {band['band']} (uplink)")
-            if dl and dl[0] <= freq_mhz <= dl[1]:
-                found.append(f"LTE Band {band['band']} (downlink)")
-
-        # Check NR bands
-        for band in NR_BANDS.get('fr1_bands', {}).get('bands', []):
-            ul = band.get('uplink_mhz')
-            dl = band.get('downlink_mhz')
-            if ul and ul[0] <= freq_mhz <= ul[1]:
-                found.append(f"NR {band['band']} (uplink)")
-            if dl and dl[0] <= freq_mhz <= dl[1]:
-                found.append(f"NR {band['band']} (downlink)")
-
-        for band in NR_BANDS.get('fr2_bands', {}).get('bands', []):
-            rng = band.get('range_mhz')
-            if rng and rng[0] <= freq_mhz <= rng[1]:
-                found.append(f"NR {band['band']}")
-
-        result = f"Bands containing {freq_mhz} MHz\n{'='*40}\n\n"
-        if found:
-            for b in found:
-                result += f"  - {b}\n"
-        else:
-            result += "  No LTE/NR bands found for this frequency.\n"
+            parts = [f"Carrier '{carrier}' not found."]
+    else:
+        parts = [f"5G NR Bands\n{'='*50}\n\n"]
 
-        # Also check ISM
-        ism = check_ism_band(freq_mhz)
-        if ism:
-            result += f"\n  ISM Band: {ism['center_mhz']} MHz center\n"
+        if freq_range in ["FR1", "ALL"]:
+            parts.append("## FR1 (Sub-6 GHz)\n")
+            for band in NR_BANDS.get('fr1_bands', {}).get('bands', []):
+                if 'uplink_mhz' in band:
+                    parts.append(f"  {band['band']:>4}: {band['uplink_mhz'][0]:>4}-{band['uplink_mhz'][1]:<4} MHz ({band['duplex']}) {band.get('name', '')}\n")
 
-        return [TextContent(type="text", text=result)]
+        if freq_range in ["FR2", "ALL"]:
+            parts.append("\n## FR2 (mmWave)\n")
+            for band in NR_BANDS.get('fr2_bands', {}).get('bands', []):
+                parts.append(f"  {band['band']:>4}: {band['range_mhz'][0]:>5}-{band['range_mhz'][1]:<5} MHz {band.get('name', '')}\n")
 
-    elif name == "cispr25_limit":
-        freq_mhz = arguments["frequency_mhz"]
-        device_class = arguments.get("device_class", 3)
-        emission_type = arguments.get("emission_type", "radiated")
+    return "".join(parts)
 
-        result = f"CISPR 25 Class {device_class} at {freq_mhz} MHz\n{'='*50}\n\n"
 
-        classes_info = CISPR25_LIMITS.get('classes', {})
-        result += f"Class {device_class}: {classes_info.get(f'class_{device_class}', 'Unknown')}\n\n"
+async def _handle_frequency_to_band(arguments: dict[str, Any]) -> str:
+    freq_mhz = arguments["frequency_mhz"]
+    return _frequency_to_band_text(freq_mhz)
 
-        limit = get_cispr25_limit(device_class, freq_mhz, emission_type)
 
-        if limit:
-            if emission_type == "radiated":
-                result += f"Radiated Emissions (@ 1m, ALSE method):\n"
-                result += f"  {limit['freq_min_mhz']} - {limit['freq_max_mhz']} MHz: {limit['limit_dbuv_m']} dBuV/m (peak)\n"
-            else:
-                result += f"Conducted Emissions (voltage method):\n"
-                result += f"  {limit['freq_min_mhz']} - {limit['freq_max_mhz']} MHz: {limit['limit_dbuv']} dBuV\n"
-        else:
-            result += f"No {emission_type} limit found for this frequency.\n"
+async def _handle_cispr25_limit(arguments: dict[str, Any]) -> str:
+    freq_mhz = arguments["frequency_mhz"]
+    device_class = arguments.get("device_class", 3)
+    emission_type = arguments.get("emission_type", "radiated")
 
-        # Show all classes for comparison
-        result += f"\n## All Classes at {freq_mhz} MHz ({emission_type}):\n"
-        for cls in [1, 2, 3, 4, 5]:
-            lim = get_cispr25_limit(cls, freq_mhz, emission_type)
-            if lim:
-                val = lim.get('limit_dbuv_m', lim.get('limit_dbuv', '?'))
-                unit = "dBuV/m" if emission_type == "radiated" else "dBuV"
-                marker = " ◄" if cls == device_class else ""
-                result += f"  Class {cls}: {val} {unit}{marker}\n"
-
-        return [TextContent(type="text", text=result)]
+    parts = [f"CISPR 25 Class {device_class} at {freq_mhz} MHz\n{'='*50}\n\n"]
 
-    elif name == "cispr12_limit":
-        freq_mhz = arguments["frequency_mhz"]
-
-        result = f"CISPR 12 Vehicle-Level Limits at {freq_mhz} MHz\n{'='*50}\n\n"
-        result += "Measurement distance: 10m\n\n"
-
-        cispr12 = AUTOMOTIVE_EMC.get('cispr_12', {})
-        bb_limits = cispr12.get('limits', {}).get('broadband', [])
-        nb_limits = cispr12.get('limits', {}).get('narrowband', [])
-
-        bb_limit = find_limit_for_frequency(bb_limits, freq_mhz)
-        nb_limit = find_limit_for_frequency(nb_limits, freq_mhz)
-
-        if bb_limit:
-            result += f"Broadband (quasi-peak):\n"
-            result += f"  {bb_limit['freq_min_mhz']} - {bb_limit['freq_max_mhz']} MHz: {bb_limit['limit_dbuv_m']} dBuV/m\n"
-        if nb_limit:
-            result += f"\nNarrowband (average):\n"
-            result += f"  {nb_limit['freq_min_mhz']} - {nb_limit['freq_max_mhz']} MHz: {nb_limit['limit_dbuv_m']} dBuV/m\n"
-
-        if not bb_limit and not nb_limit:
-            result += "No limits defined for this frequency (typically 30-1000 MHz).\n"
-
-        return [TextContent(type="text", text=result)]
-
-    elif name == "iso11452_levels":
-        result = "ISO 11452-2 Radiated Immunity Test Levels\n" + "="*50 + "\n\n"
-
-        iso_data = AUTOMOTIVE_EMC.get('iso_11452_2', {})
-        result += f"{iso_data.get('title', '')}\n"
-        result += f"Frequency range: {iso_data.get('test_levels', {}).get('frequency_range', {}).get('min_mhz', '?')}-"
-        result += f"{iso_data.get('test_levels', {}).get('frequency_range', {}).get('max_mhz', '?')} MHz\n"
-        result += f"Modulation: {iso_data.get('test_levels', {}).get('modulation', '1 kHz AM, 80%')}\n\n"
-
-        result += "## Test Severity Levels:\n"
-        for level in iso_data.get('test_levels', {}).get('levels', []):
-            result += f"  Level {level['level']}: {level['field_strength_v_m']} V/m - {level['typical_use']}\n"
-
-        result += "\n## Typical OEM Requirements:\n"
-        for req in iso_data.get('oem_requirements', {}).get('examples', []):
-            result += f"  {req['oem']}: {req['level_v_m']} V/m ({req['range_mhz'][0]}-{req['range_mhz'][1]} MHz)\n"
-
-        return [TextContent(type="text", text=result)]
-
-    elif name == "iso7637_pulses":
-        result = "ISO 7637-2 Conducted Transient Test Pulses\n" + "="*50 + "\n\n"
-
-        iso_data = AUTOMOTIVE_EMC.get('iso_7637_2', {})
-        result += f"{iso_data.get('title', '')}\n\n"
-
-        for pulse in iso_data.get('test_pulses', []):
-            result += f"## Pulse {pulse['pulse']}\n"
-            result += f"  Description: {pulse['description']}\n"
-            if 'voltage_range_v' in pulse:
-                result += f"  Voltage: {pulse['voltage_range_v'][0]} to {pulse['voltage_range_v'][1]} V\n"
-            if 'rise_time_us' in pulse:
-                result += f"  Rise time: {pulse['rise_time_us']} µs\n"
-            elif 'rise_time_ns' in pulse:
-                result += f"  Rise time: {pulse['rise_time_ns']} ns\n"
-            result += "\n"
-
-        result += "## Functional Status Classes:\n"
-        for cls in iso_data.get('functional_status', {}).get('classes', []):
-            result += f"  Class {cls['class']}: {cls['description']}\n"
-
-        return [TextContent(type="text", text=result)]
-
-    elif name == "automotive_emc_overview":
-        result = "Automotive EMC Standards Overview\n" + "="*50 + "\n\n"
-
-        comparison = AUTOMOTIVE_EMC.get('comparison_chart', {})
-        result += "## Standards Summary:\n"
-        for std in comparison.get('standards', []):
-            result += f"  {std['standard']:12} | {std['scope']:35} | {std['type']}\n"
-
-        result += "\n## CISPR 25 Classes (Component Emissions):\n"
-        classes = CISPR25_LIMITS.get('classes', {})
-        for i in range(1, 6):
-            result += f"  Class {i}: {classes.get(f'class_{i}', 'Unknown')}\n"
-
-        result += "\n## ISO 11452-2 Levels (Component Immunity):\n"
-        for level in AUTOMOTIVE_EMC.get('iso_11452_2', {}).get('test_levels', {}).get('levels', [])[:4]:
-            result += f"  Level {level['level']}: {level['field_strength_v_m']} V/m\n"
-
-        result += "\n## Typical OEM Requirements:\n"
-        for req in CISPR25_LIMITS.get('oem_requirements', {}).get('examples', [])[:5]:
-            result += f"  {req['component']:25} → Class {req['typical_class']}\n"
-
-        return [TextContent(type="text", text=result)]
-
-    elif name == "emc_standards_list":
-        result = "Available EMC Standards and Regulations\n" + "="*45 + "\n\n"
-
-        result += "## FCC (United States)\n"
-        result += "  ✓ Part 15.109 - Radiated emissions (unintentional)\n"
-        result += "  ✓ Part 15.207 - Conducted emissions\n"
-        result += "  ✓ Part 15.209 - Radiated emissions (intentional)\n"
-        result += "  ✓ Part 15.205 - Restricted frequency bands\n"
-        result += "  ✓ Part 18 - ISM equipment\n\n"
+    classes_info = CISPR25_LIMITS.get('classes', {})
+    parts.append(f"Class {device_class}: {classes_info.get(f'class_{device_class}', 'Unknown')}\n\n")
 
-        result += "## CISPR (International)\n"
-        result += "  ✓ CISPR 11 - Industrial, scientific, medical equipment\n"
-        result += "  ✓ CISPR 32 - Multimedia equipment (replaces CISPR 22)\n"
-        result += "  ✓ CISPR 14-1 - Household appliances\n\n"
-
-        result += "## Automotive EMC\n"
-        result += "  ✓ CISPR 25 - Component emissions (Classes 1-5)\n"
-        result += "  ✓ CISPR 12 - Vehicle-level emissions\n"
-        result += "  ✓ ISO 11452-2 - Radiated immunity\n"
-        result += "  ✓ ISO 7637-2 - Conducted transients\n\n"
-
-        result += "## Cellular (3GPP)\n"
-        result += "  ✓ LTE bands (E-UTRA)\n"
-        result += "  ✓ 5G NR bands (FR1 + FR2)\n"
-        result += "  ✓ US carrier band info (AT&T, Verizon, T-Mobile)\n\n"
-
-        result += "## Coming Soon\n"
-        result += "  - IEC 60601-1-2 - Medical devices\n"
-        result += "  - PTCRB certification requirements\n"
+    limit = get_cispr25_limit(device_class, freq_mhz, emission_type)
 
-        return [TextContent(type="text", text=result)]
-
-    elif name == "ecfr_query":
-        title = arguments["title"]
-        part = arguments["part"]
-        section = arguments.get("section")
-
-        if section:
-            url = f"https://www.ecfr.gov/api/versioner/v1/full/current/title-{title}.json?part={part}&section={section}"
+    if limit:
+        if emission_type == "radiated":
+            parts.append(f"Radiated Emissions (@ 1m, ALSE method):\n")
+            parts.append(f"  {limit.freq_min_mhz} - {limit.freq_max_mhz} MHz: {limit.limit_dbuv_m} dBuV/m (peak)\n")
         else:
-            url = f"https://www.ecfr.gov/api/versioner/v1/structure/current/title-{title}.json?part={part}"
+            parts.append(f"Conducted Emissions (voltage method):\n")
+            parts.append(f"  {limit.freq_min_mhz} - {limit.freq_max_mhz} MHz: {limit.limit_dbuv} dBuV\n")
+    else:
+        parts.append(f"No {emission_type} limit found for this frequency.\n")
+
+    # Show all classes for comparison
+    parts.append(f"\n## All Classes at {freq_mhz} MHz ({emission_type}):\n")
+    for cls in [1, 2, 3, 4, 5]:
+        lim = get_cispr25_limit(cls, freq_mhz, emission_type)
+        if lim:
+            val = _or_unknown(lim.limit_dbuv_m if lim.limit_dbuv_m is not None else lim.limit_dbuv)
+            unit = "dBuV/m" if emission_type == "radiated" else "dBuV"
+            marker = " ◄" if cls == device_class else ""
+            parts.append(f"  Class {cls}: {val} {unit}{marker}\n")
+
+    return "".join(parts)
+
+
+async def _handle_cispr12_limit(arguments: dict[str, Any]) -> str:
+    freq_mhz = arguments["frequency_mhz"]
+
+    parts = [f"CISPR 12 Vehicle-Level Limits at {freq_mhz} MHz\n{'='*50}\n\n"]
+    parts.append("Measurement distance: 10m\n\n")
+
+    bb_limit = first_in_interval_index(CISPR12_BROADBAND_INDEX, freq_mhz)
+    nb_limit = first_in_interval_index(CISPR12_NARROWBAND_INDEX, freq_mhz)
+
+    if bb_limit:
+        parts.append(f"Broadband (quasi-peak):\n")
+        parts.append(f"  {bb_limit.freq_min_mhz} - {bb_limit.freq_max_mhz} MHz: {bb_limit.limit_dbuv_m} dBuV/m\n")
+    if nb_limit:
+        parts.append(f"\nNarrowband (average):\n")
+        parts.append(f"  {nb_limit.freq_min_mhz} - {nb_limit.freq_max_mhz} MHz: {nb_limit.limit_dbuv_m} dBuV/m\n")
+
+    if not bb_limit and not nb_limit:
+        parts.append("No limits defined for this frequency (typically 30-1000 MHz).\n")
+
+    return "".join(parts)
+
+
+async def _handle_iso11452_levels(arguments: dict[str, Any]) -> str:
+    parts = ["ISO 11452-2 Radiated Immunity Test Levels\n" + "="*50 + "\n\n"]
+
+    iso_data = AUTOMOTIVE_EMC.get('iso_11452_2', {})
+    parts.append(f"{iso_data.get('title', '')}\n")
+    parts.append(f"Frequency range: {iso_data.get('test_levels', {}).get('frequency_range', {}).get('min_mhz', '?')}-")
+    parts.append(f"{iso_data.get('test_levels', {}).get('frequency_range', {}).get('max_mhz', '?')} MHz\n")
+    parts.append(f"Modulation: {iso_data.get('test_levels', {}).get('modulation', '1 kHz AM, 80%')}\n\n")
+
+    parts.append("## Test Severity Levels:\n")
+    for level in iso_data.get('test_levels', {}).get('levels', []):
+        parts.append(f"  Level {level['level']}: {level['field_strength_v_m']} V/m - {level['typical_use']}\n")
+
+    parts.append("\n## Typical OEM Requirements:\n")
+    for req in iso_data.get('oem_requirements', {}).get('examples', []):
+        parts.append(f"  {req['oem']}: {req['level_v_m']} V/m ({req['range_mhz'][0]}-{req['range_mhz'][1]} MHz)\n")
+
+    return "".join(parts)
+
+
+async def _handle_iso7637_pulses(arguments: dict[str, Any]) -> str:
+    parts = ["ISO 7637-2 Conducted Transient Test Pulses\n" + "="*50 + "\n\n"]
+
+    iso_data = AUTOMOTIVE_EMC.get('iso_7637_2', {})
+    parts.append(f"{iso_data.get('title', '')}\n\n")
+
+    for pulse in iso_data.get('test_pulses', []):
+        parts.append(f"## Pulse {pulse['pulse']}\n")
+        parts.append(f"  Description: {pulse['description']}\n")
+        if 'voltage_range_v' in pulse:
+            parts.append(f"  Voltage: {pulse['voltage_range_v'][0]} to {pulse['voltage_range_v'][1]} V\n")
+        if 'rise_time_us' in pulse:
+            parts.append(f"  Rise time: {pulse['rise_time_us']} µs\n")
+        elif 'rise_time_ns' in pulse:
+            parts.append(f"  Rise time: {pulse['rise_time_ns']} ns\n")
+        parts.append("\n")
+
+    parts.append("## Functional Status Classes:\n")
+    for cls in iso_data.get('functional_status', {}).get('classes', []):
+        parts.append(f"  Class {cls['class']}: {cls['description']}\n")
+
+    return "".join(parts)
+
+
+async def _handle_automotive_emc_overview(arguments: dict[str, Any]) -> str:
+    parts = ["Automotive EMC Standards Overview\n" + "="*50 + "\n\n"]
+
+    comparison = AUTOMOTIVE_EMC.get('comparison_chart', {})
+    parts.append("## Standards Summary:\n")
+    for std in comparison.get('standards', []):
+        parts.append(f"  {std['standard']:12} | {std['scope']:35} | {std['type']}\n")
+
+    parts.append("\n## CISPR 25 Classes (Component Emissions):\n")
+    classes = CISPR25_LIMITS.get('classes', {})
+    for i in range(1, 6):
+        parts.append(f"  Class {i}: {classes.get(f'class_{i}', 'Unknown')}\n")
+
+    parts.append("\n## ISO 11452-2 Levels (Component Immunity):\n")
+    for level in AUTOMOTIVE_EMC.get('iso_11452_2', {}).get('test_levels', {}).get('levels', [])[:4]:
+        parts.append(f"  Level {level['level']}: {level['field_strength_v_m']} V/m\n")
+
+    parts.append("\n## Typical OEM Requirements:\n")
+    for req in CISPR25_LIMITS.get('oem_requirements', {}).get('examples', [])[:5]:
+        parts.append(f"  {req['component']:25} → Class {req['typical_class']}\n")
+
+    return "".join(parts)
+
+
+async def _handle_emc_standards_list(arguments: dict[str, Any]) -> str:
+    return EMC_STANDARDS_TEXT
+
+
+async def _handle_ecfr_query(arguments: dict[str, Any]) -> str:
+    title = arguments["title"]
+    part = arguments["part"]
+    section = arguments.get("section")
+
+    if section:
+        url = f"https://www.ecfr.gov/api/versioner/v1/full/current/title-{title}.json?part={part}&section={section}"
+    else:
+        url = f"https://www.ecfr.gov/api/versioner/v1/structure/current/title-{title}.json?part={part}"
+
+    cached = ecfr_cache_get(url)
+    if cached is not None:
+        return cached
+
+    # Concurrent misses for the same URL share one fetch
+    async with ecfr_fetch_lock(url):
+        cached = ecfr_cache_get(url)
+        if cached is not None:
+            return cached
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, timeout=30.0)
-                if response.status_code == 200:
-                    data = response.json()
-                    result = f"eCFR Query: Title {title}, Part {part}"
-                    if section:
-                        result += f", Section {section}"
-                    result += f"\n{'='*50}\n\n"
-                    result += json.dumps(data, indent=2)[:8000]
-                else:
-                    result = f"eCFR API returned status {response.status_code}"
+            # Streamed so error responses are answered without reading their body
+            async with get_http_client().stream("GET", url) as response:
+                content = await response.aread() if response.status_code == 200 else None
+            if content is not None:
+                data = json_loads(content)
+                parts = [f"eCFR Query: Title {title}, Part {part}"]
+                if section:
+                    parts.append(f", Section {section}")
+                parts.append(f"\n{'='*50}\n\n")
+                text, truncated = dumps_truncated(data, ECFR_MAX_CHARS)
+                parts.append(text)
+                if truncated:
+                    parts.append("\n\n[Output truncated...]")
+                result = "".join(parts)
+                ecfr_cache_put(url, result)
+                return result
+            error = f"eCFR API returned status {response.status_code}"
         except Exception as e:
-            result = f"Error querying eCFR API: {str(e)}"
+            error = f"Error querying eCFR API: {str(e)}"
+
+    # Prefer an expired copy over an error
+    stale = ecfr_cache_get(url, max_age_s=float('inf'))
+    return error if stale is None else stale
+
+
+TOOL_HANDLERS: dict[str, Callable[[dict[str, Any]], Awaitable[str]]] = {
+    "fcc_part15_limit": _handle_fcc_part15_limit,
+    "fcc_part18_limit": _handle_fcc_part18_limit,
+    "fcc_restricted_bands": _handle_fcc_restricted_bands,
+    "fcc_restricted_bands_list": _handle_fcc_restricted_bands_list,
+    "ism_bands_list": _handle_ism_bands_list,
+    "cispr_limit": _handle_cispr_limit,
+    "emc_compare_limits": _handle_emc_compare_limits,
+    "lte_band_lookup": _handle_lte_band_lookup,
+    "lte_bands_list": _handle_lte_bands_list,
+    "nr_band_lookup": _handle_nr_band_lookup,
+    "nr_bands_list": _handle_nr_bands_list,
+    "frequency_to_band": _handle_frequency_to_band,
+    "cispr25_limit": _handle_cispr25_limit,
+    "cispr12_limit": _handle_cispr12_limit,
+    "iso11452_levels": _handle_iso11452_levels,
+    "iso7637_pulses": _handle_iso7637_pulses,
+    "automotive_emc_overview": _handle_automotive_emc_overview,
+    "emc_standards_list": _handle_emc_standards_list,
+    "ecfr_query": _handle_ecfr_query,
+}
 
-        return [TextContent(type="text", text=result)]
 
-    else:
+@server.call_tool()
+async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
         return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    return [TextContent(type="text", text=await handler(arguments))]
 
 
 async def run():
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+    finally:
+        await close_http_client()
 
 
 def main():
-    import asyncio
     asyncio.run(run())
 
 